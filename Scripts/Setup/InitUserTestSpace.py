@@ -2,7 +2,7 @@
 # Path: /home/herb/Desktop/AndyLibrary/InitUserTestSpace.py
 # Standard: AIDEV-PascalCase-2.1
 # Created: 2025-07-24
-# Last Modified: 2025-07-24 10:35AM
+# Last Modified: 2025-07-24 05:55PM
 
 """
 Initialize Clean User Test Environment
@@ -17,6 +17,17 @@ import json
 from pathlib import Path
 from datetime import datetime
 
+def _write_executable(path, text):
+    """Write a generated script that is executable from the moment it exists"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o755)
+    # The open mode only applies on creation and is filtered by the umask,
+    # so set it explicitly for reruns over an existing file (Windows has no
+    # fchmod before Python 3.13 and no execute bit to set anyway)
+    with os.fdopen(fd, 'wb') as f:
+        if hasattr(os, 'fchmod'):
+            os.fchmod(f.fileno(), 0o755)
+        f.write(text.encode('utf-8'))
+
 class UserTestEnvironment:
     """Create and manage clean test environment for user testing"""
     
@@ -217,11 +228,7 @@ except Exception as e:
 """
         
         launcher_path = self.test_dir / "launch_test.py"
-        with open(launcher_path, 'w') as f:
-            f.write(launcher_script)
-        
-        # Make executable
-        os.chmod(launcher_path, 0o755)
+        _write_executable(launcher_path, launcher_script)
         
         print(f"   ✅ Test launcher: {launcher_path}")
         
@@ -273,9 +280,7 @@ if __name__ == "__main__":
 """
         
         inspector_path = self.test_dir / "inspect_db.py"
-        with open(inspector_path, 'w') as f:
-            f.write(inspector_script)
-        os.chmod(inspector_path, 0o755)
+        _write_executable(inspector_path, inspector_script)
         
         # Version tester
         version_tester = f"""#!/usr/bin/env python3
@@ -307,9 +312,7 @@ if __name__ == "__main__":
 """
         
         version_test_path = self.test_dir / "test_version.py"
-        with open(version_test_path, 'w') as f:
-            f.write(version_tester)
-        os.chmod(version_test_path, 0o755)
+        _write_executable(version_test_path, version_tester)
         
         print(f"   ✅ Database inspector: {inspector_path}")
         print(f"   ✅ Version API tester: {version_test_path}")
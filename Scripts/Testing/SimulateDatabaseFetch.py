@@ -2,7 +2,7 @@
 # Path: /home/herb/Desktop/AndyLibrary/SimulateDatabaseFetch.py
 # Standard: AIDEV-PascalCase-2.1
 # Created: 2025-07-24
-# Last Modified: 2025-07-24 09:50AM
+# Last Modified: 2025-07-24 04:00PM
 
 """
 Simulate database fetch and setup for use
@@ -10,14 +10,20 @@ Simple test to download DB to temp location and launch app to use it
 """
 
 import os
+import json
+import shlex
 import shutil
+import socket
 import tempfile
-import sqlite3
 import subprocess
 import sys
 import time
+from http.client import HTTPConnection
 from pathlib import Path
 
+from FastCopy import fast_copy
+from TestHelpers import open_db, write_json
+
 class DatabaseFetchSimulator:
     """Simulate fetching database and setting up app to use it"""
     
@@ -26,6 +32,7 @@ class DatabaseFetchSimulator:
         self.source_db = self.project_root / "Data" / "Local" / "cached_library.db"
         self.temp_dir = None
         self.temp_db_path = None
+        self._temp_files = []
         
     def simulate_database_fetch(self):
         """Simulate downloading database to temp location"""
@@ -34,21 +41,25 @@ class DatabaseFetchSimulator:
         # Create temp directory
         self.temp_dir = tempfile.mkdtemp(prefix="andylibrary_")
         self.temp_db_path = os.path.join(self.temp_dir, "fetched_library.db")
+        # WAL sidecars are normally removed on close but may be left behind
+        self._temp_files = [self.temp_db_path + suffix for suffix in ("", "-wal", "-shm")]
         
         print(f"📁 Temp location: {self.temp_dir}")
         
-        # Check source database exists
-        if not self.source_db.exists():
+        # Check source database exists (the stat also gives us its size)
+        try:
+            source_stat = os.stat(self.source_db)
+        except FileNotFoundError:
             print(f"❌ Source database not found: {self.source_db}")
             return False
         
         try:
             # Simulate the fetch (copy to temp location)
             print("🔄 Fetching database...")
-            shutil.copy2(self.source_db, self.temp_db_path)
+            fast_copy(self.source_db, self.temp_db_path, preserve_metadata=False)
             
-            # Verify the fetched database
-            file_size = os.path.getsize(self.temp_db_path)
+            # Verify the fetched database (the copy is byte-for-byte the source)
+            file_size = source_stat.st_size
             print(f"✅ Database fetched successfully")
             print(f"   📍 Location: {self.temp_db_path}")
             print(f"   💾 Size: {file_size / 1024:.1f} KB")
@@ -64,11 +75,13 @@ class DatabaseFetchSimulator:
         print("\n📊 Verifying fetched database content...")
         
         try:
-            conn = sqlite3.connect(self.temp_db_path)
+            conn = open_db(self.temp_db_path)
             
-            # Basic content check
-            book_count = conn.execute("SELECT COUNT(*) FROM books").fetchone()[0]
-            category_count = conn.execute("SELECT COUNT(*) FROM categories").fetchone()[0]
+            # Basic content check (one statement for both counts)
+            book_count, category_count = conn.execute("""
+                SELECT (SELECT COUNT(*) FROM books),
+                       (SELECT COUNT(*) FROM categories)
+            """).fetchone()
             
             print(f"✅ Database content verified:")
             print(f"   📚 {book_count} books")
@@ -102,10 +115,9 @@ class DatabaseFetchSimulator:
             }
             
             self.temp_config_path = os.path.join(self.temp_dir, "temp_config.json")
+            self._temp_files.append(self.temp_config_path)
             
-            import json
-            with open(self.temp_config_path, 'w') as f:
-                json.dump(temp_config, f, indent=2)
+            write_json(self.temp_config_path, temp_config)
             
             print(f"✅ Config created: {self.temp_config_path}")
             print(f"   🎯 Database path: {self.temp_db_path}")
@@ -122,44 +134,25 @@ class DatabaseFetchSimulator:
         print("\n🚀 Launching app with fetched database...")
         
         try:
-            # Create a simple launcher script that uses our temp database
-            launcher_script = f"""
-import os
-import sys
-
-# Add project to path
-sys.path.insert(0, '{self.project_root}')
-
-# Set environment to use our temp database
-os.environ['ANDYGOOGLE_TEMP_DB'] = '{self.temp_db_path}'
-os.environ['ANDYGOOGLE_MODE'] = 'local'
-
-# Import and start server
-from Source.API.MainAPI import app
-import uvicorn
-
-print("🔍 Using temp database: {self.temp_db_path}")
-print("🌐 Starting server on port 8090...")
-
-uvicorn.run(app, host="127.0.0.1", port=8090, log_level="warning")
-"""
-            
-            launcher_path = os.path.join(self.temp_dir, "launch_temp_app.py")
-            with open(launcher_path, 'w') as f:
-                f.write(launcher_script)
-            
-            print(f"✅ Launcher created: {launcher_path}")
+            # The launcher is a fixed module; the database path is its argument
+            launcher_path = self.project_root / "TempAppLauncher.py"
+            if not launcher_path.exists():
+                print(f"❌ Launcher not found: {launcher_path}")
+                return None
+            launch_command = [sys.executable, str(launcher_path), self.temp_db_path]
+            
+            print(f"✅ Launcher ready: {launcher_path}")
             print("🌐 App should start on: http://127.0.0.1:8090")
             print("\n▶️ Ready to launch! Run:")
-            print(f"   python {launcher_path}")
+            print(f"   {shlex.join(launch_command)}")
             
-            return launcher_path
+            return launch_command
             
         except Exception as e:
-            print(f"❌ Launcher creation failed: {e}")
+            print(f"❌ Launcher setup failed: {e}")
             return None
     
-    def test_app_connectivity(self, launcher_path):
+    def test_app_connectivity(self, launch_command):
         """Test that the app can be launched and responds"""
         print("\n🧪 Testing app connectivity...")
         
@@ -167,40 +160,58 @@ uvicorn.run(app, host="127.0.0.1", port=8090, log_level="warning")
             # Launch app in background
             print("⏳ Starting app (5 second test)...")
             
-            # Set environment variables for the subprocess
-            env = os.environ.copy()
-            env['ANDYGOOGLE_TEMP_DB'] = self.temp_db_path
-            env['ANDYGOOGLE_MODE'] = 'local'
-            
-            process = subprocess.Popen([
-                sys.executable, launcher_path
-            ], env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            
-            # Give it time to start
-            time.sleep(3)
+            # Environment for the subprocess: ours plus the temp database
+            env = os.environ | {
+                'ANDYGOOGLE_TEMP_DB': self.temp_db_path,
+                'ANDYGOOGLE_MODE': 'local'
+            }
             
-            # Quick test if it's responding
+            process = subprocess.Popen(launch_command, env=env,
+                                       stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            
+            # Wait until the port accepts connections (up to 3 seconds)
+            # rather than always sleeping the full startup allowance
+            deadline = time.monotonic() + 3
+            delay = 0.05
+            while time.monotonic() < deadline and process.poll() is None:
+                with socket.socket() as probe:
+                    probe.settimeout(0.1)
+                    try:
+                        probe.connect(("127.0.0.1", 8090))
+                        break
+                    except OSError:
+                        time.sleep(delay)
+                        delay = min(delay * 2, 0.5)
+            
+            # Quick test if it's responding; both probes share one
+            # keep-alive connection
+            connection = HTTPConnection("127.0.0.1", 8090, timeout=2)
             try:
-                import requests
-                response = requests.get("http://127.0.0.1:8090/api/health", timeout=2)
-                if response.status_code == 200:
+                connection.request("GET", "/api/health")
+                response = connection.getresponse()
+                response.read()
+                if response.status == 200:
                     print("✅ App launched successfully!")
                     print("✅ Health check passed")
                     
                     # Quick database test
-                    stats_response = requests.get("http://127.0.0.1:8090/api/stats", timeout=2)
-                    if stats_response.status_code == 200:
-                        stats = stats_response.json()
+                    connection.request("GET", "/api/stats")
+                    stats_response = connection.getresponse()
+                    stats_body = stats_response.read()
+                    if stats_response.status == 200:
+                        stats = json.loads(stats_body)
                         print(f"✅ Database working: {stats.get('total_books')} books")
                     
                     success = True
                 else:
-                    print(f"⚠️ App responded with status: {response.status_code}")
+                    print(f"⚠️ App responded with status: {response.status}")
                     success = False
                     
             except Exception as e:
                 print(f"⚠️ Connectivity test failed: {e}")
                 success = False
+            finally:
+                connection.close()
             
             # Clean up process
             process.terminate()
@@ -216,15 +227,24 @@ uvicorn.run(app, host="127.0.0.1", port=8090, log_level="warning")
         """Clean up temporary files"""
         if self.temp_dir and os.path.exists(self.temp_dir):
             try:
-                shutil.rmtree(self.temp_dir)
+                # Remove the files we know we created, then the directory;
+                # only walk the tree if something unexpected is left
+                for path in self._temp_files:
+                    try:
+                        os.unlink(path)
+                    except FileNotFoundError:
+                        pass
+                try:
+                    os.rmdir(self.temp_dir)
+                except OSError:
+                    shutil.rmtree(self.temp_dir)
                 print(f"🧹 Cleaned up temp directory: {self.temp_dir}")
             except Exception as e:
                 print(f"⚠️ Cleanup warning: {e}")
     
     def run_simulation(self):
         """Run complete database fetch simulation"""
-        print("🎯 DATABASE FETCH & SETUP SIMULATION")
-        print("=" * 45)
+        sys.stdout.write("🎯 DATABASE FETCH & SETUP SIMULATION\n" + "=" * 45 + "\n")
         
         try:
             # Step 1: Simulate database fetch
@@ -236,8 +256,8 @@ uvicorn.run(app, host="127.0.0.1", port=8090, log_level="warning")
                 return False
             
             # Step 3: Create launcher
-            launcher_path = self.launch_app_with_temp_database()
-            if not launcher_path:
+            launch_command = self.launch_app_with_temp_database()
+            if not launch_command:
                 return False
             
             # Step 4: Test connectivity (optional)
@@ -245,28 +265,31 @@ uvicorn.run(app, host="127.0.0.1", port=8090, log_level="warning")
             test_choice = input().strip().lower()
             
             if test_choice == 'y':
-                connectivity_ok = self.test_app_connectivity(launcher_path)
+                connectivity_ok = self.test_app_connectivity(launch_command)
             else:
                 connectivity_ok = True
                 print("⏭️ Skipping connectivity test")
             
-            print("\n" + "=" * 45)
-            print("📋 SIMULATION RESULTS")
-            print("=" * 45)
-            print("✅ Database fetch: SUCCESS")
-            print("✅ Database verification: SUCCESS")
-            print("✅ App launcher: SUCCESS")
+            # Assemble the summary and write it in one go
+            out = []
+            out.append("\n" + "=" * 45)
+            out.append("📋 SIMULATION RESULTS")
+            out.append("=" * 45)
+            out.append("✅ Database fetch: SUCCESS")
+            out.append("✅ Database verification: SUCCESS")
+            out.append("✅ App launcher: SUCCESS")
             
             if test_choice == 'y':
-                print(f"{'✅' if connectivity_ok else '⚠️'} Connectivity test: {'SUCCESS' if connectivity_ok else 'PARTIAL'}")
+                out.append(f"{'✅' if connectivity_ok else '⚠️'} Connectivity test: {'SUCCESS' if connectivity_ok else 'PARTIAL'}")
             
-            print(f"\n🎯 READY TO USE:")
-            print(f"   📁 Database: {self.temp_db_path}")
-            print(f"   🚀 Launcher: {launcher_path}")
-            print(f"   🌐 URL: http://127.0.0.1:8090")
+            out.append(f"\n🎯 READY TO USE:")
+            out.append(f"   📁 Database: {self.temp_db_path}")
+            out.append(f"   🚀 Launcher: {launch_command[1]}")
+            out.append(f"   🌐 URL: http://127.0.0.1:8090")
             
-            print(f"\n▶️ To launch app:")
-            print(f"   python {launcher_path}")
+            out.append(f"\n▶️ To launch app:")
+            out.append(f"   {shlex.join(launch_command)}")
+            sys.stdout.write("\n".join(out) + "\n")
             
             return True
             
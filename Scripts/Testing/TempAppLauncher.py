@@ -0,0 +1,41 @@
+# File: TempAppLauncher.py
+# Path: /home/herb/Desktop/AndyLibrary/TempAppLauncher.py
+# Standard: AIDEV-PascalCase-2.1
+# Created: 2025-07-24
+# Last Modified: 2025-07-24 12:15PM
+
+"""
+Temp Database App Launcher
+Starts the app against a fetched database: python TempAppLauncher.py <db_path>
+"""
+
+import os
+import sys
+
+def main():
+    """Point the app at the given database and start the server"""
+    if len(sys.argv) != 2:
+        print("Usage: python TempAppLauncher.py <db_path>")
+        return 1
+
+    temp_db_path = sys.argv[1]
+
+    # Add project to path
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+    # Set environment to use our temp database
+    os.environ['ANDYGOOGLE_TEMP_DB'] = temp_db_path
+    os.environ['ANDYGOOGLE_MODE'] = 'local'
+
+    # Import and start server
+    from Source.API.MainAPI import app
+    import uvicorn
+
+    print(f"🔍 Using temp database: {temp_db_path}")
+    print("🌐 Starting server on port 8090...")
+
+    uvicorn.run(app, host="127.0.0.1", port=8090, log_level="warning")
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
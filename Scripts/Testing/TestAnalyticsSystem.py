@@ -2,7 +2,7 @@
 # Path: /home/herb/Desktop/AndyLibrary/TestAnalyticsSystem.py
 # Standard: AIDEV-PascalCase-2.1
 # Created: 2025-07-24
-# Last Modified: 2025-07-24 10:30AM
+# Last Modified: 2025-07-24 04:25PM
 
 """
 Test the analytics and logging system for educational insights
@@ -16,6 +16,12 @@ from Source.Utils.SheetsLogger import SheetsLogger
 import json
 import tempfile
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 def test_educational_analytics():
     """Test the educational analytics system"""
     print("📊 TESTING EDUCATIONAL ANALYTICS SYSTEM")
@@ -77,78 +83,83 @@ def test_educational_analytics():
             session_duration=1200.0  # 20 minutes
         )
     
-    # Get analytics
-    print("\\n📈 ANALYTICS RESULTS:")
-    print("-" * 40)
+    # Get analytics (the report is assembled and written in one go)
+    out = []
+    out.append("\\n📈 ANALYTICS RESULTS:")
+    out.append("-" * 40)
     
     analytics = logger.GetDataUsageAnalytics(30)
     
     if analytics:
-        print(f"📊 Data Usage Summary ({analytics['period_days']} days):")
-        print(f"   📥 Total downloads: {analytics['total_downloads']}")
-        print(f"   💾 Total MB downloaded: {analytics['total_mb_downloaded']}")
-        print(f"   💰 Estimated user cost: ${analytics['total_estimated_cost_usd']:.2f}")
-        print(f"   🔍 Version checks: {analytics['total_version_checks']}")
-        print(f"   ✅ Efficiency ratio: {analytics['efficiency_ratio']:.1f}x")
-        print(f"   🛡️ Data protection: {'ENABLED' if analytics['data_protection_enabled'] else 'DISABLED'}")
+        out.append(f"📊 Data Usage Summary ({analytics['period_days']} days):")
+        out.append(f"   📥 Total downloads: {analytics['total_downloads']}")
+        out.append(f"   💾 Total MB downloaded: {analytics['total_mb_downloaded']}")
+        out.append(f"   💰 Estimated user cost: ${analytics['total_estimated_cost_usd']:.2f}")
+        out.append(f"   🔍 Version checks: {analytics['total_version_checks']}")
+        out.append(f"   ✅ Efficiency ratio: {analytics['efficiency_ratio']:.1f}x")
+        out.append(f"   🛡️ Data protection: {'ENABLED' if analytics['data_protection_enabled'] else 'DISABLED'}")
         
-        print(f"\\n📱 Connection Patterns:")
+        out.append(f"\\n📱 Connection Patterns:")
         for conn_type, count in analytics['connection_patterns'].items():
-            print(f"   {conn_type}: {count} downloads")
+            out.append(f"   {conn_type}: {count} downloads")
         
-        print(f"\\n💡 EDUCATIONAL IMPACT:")
+        out.append(f"\\n💡 EDUCATIONAL IMPACT:")
         efficiency = analytics['efficiency_ratio']
         cost = analytics['total_estimated_cost_usd']
         
         if efficiency > 5:
-            print("   ✅ EXCELLENT: Version control protecting students from data costs")
+            out.append("   ✅ EXCELLENT: Version control protecting students from data costs")
         elif efficiency > 2:
-            print("   👍 GOOD: Reasonable data protection in place")
+            out.append("   👍 GOOD: Reasonable data protection in place")
         else:
-            print("   ⚠️ NEEDS IMPROVEMENT: Students may be wasting data")
+            out.append("   ⚠️ NEEDS IMPROVEMENT: Students may be wasting data")
         
         if cost < 5:
-            print("   💚 LOW COST: Highly accessible for students in developing regions")
+            out.append("   💚 LOW COST: Highly accessible for students in developing regions")
         elif cost < 15:
-            print("   💛 MODERATE COST: Acceptable for most educational budgets")
+            out.append("   💛 MODERATE COST: Acceptable for most educational budgets")
         else:
-            print("   💸 HIGH COST: May be barrier to educational access")
+            out.append("   💸 HIGH COST: May be barrier to educational access")
         
-        print(f"\\n🎯 MISSION INSIGHTS:")
+        out.append(f"\\n🎯 MISSION INSIGHTS:")
         total_checks = analytics['total_version_checks']
         total_downloads = analytics['total_downloads']
         
-        print(f"   📊 Smart usage: {total_checks} checks prevented {total_checks - total_downloads} unnecessary downloads")
-        print(f"   💰 Cost savings: ~${(total_checks - total_downloads) * 1.03:.2f} saved for students")
-        print(f"   🌍 Accessibility: Data protection {'ENABLED' if efficiency > 3 else 'NEEDS WORK'}")
+        out.append(f"   📊 Smart usage: {total_checks} checks prevented {total_checks - total_downloads} unnecessary downloads")
+        out.append(f"   💰 Cost savings: ~${(total_checks - total_downloads) * 1.03:.2f} saved for students")
+        out.append(f"   🌍 Accessibility: Data protection {'ENABLED' if efficiency > 3 else 'NEEDS WORK'}")
         
         # Regional insights
-        print(f"\\n🌍 DEPLOYMENT RECOMMENDATIONS:")
+        out.append(f"\\n🌍 DEPLOYMENT RECOMMENDATIONS:")
         if efficiency > 5:
-            print("   ✅ Ready for global deployment in data-sensitive regions")
-            print("   ✅ Strong protection against student data costs") 
-            print("   ✅ Sustainable for educational mission")
+            out.append("   ✅ Ready for global deployment in data-sensitive regions")
+            out.append("   ✅ Strong protection against student data costs")
+            out.append("   ✅ Sustainable for educational mission")
         else:
-            print("   ⚠️ Implement mandatory version checking before wide deployment")
-            print("   ⚠️ Add user education about data costs")
-            print("   ⚠️ Consider progressive loading for slow connections")
+            out.append("   ⚠️ Implement mandatory version checking before wide deployment")
+            out.append("   ⚠️ Add user education about data costs")
+            out.append("   ⚠️ Consider progressive loading for slow connections")
     
     else:
-        print("❌ No analytics data available")
+        out.append("❌ No analytics data available")
     
     # Show raw log data location
     if os.path.exists(logger.local_log_path):
-        print(f"\\n📁 Raw analytics data: {logger.local_log_path}")
-        with open(logger.local_log_path, 'r') as f:
-            log_data = json.load(f)
-            print(f"   📝 Total log entries: {len(log_data.get('entries', []))}")
+        out.append(f"\\n📁 Raw analytics data: {logger.local_log_path}")
+        # Read the raw bytes once; orjson parses them much faster when present
+        with open(logger.local_log_path, 'rb') as f:
+            raw = f.read()
+        log_data = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+        out.append(f"   📝 Total log entries: {len(log_data.get('entries', []))}")
+    
+    out.append(f"\\n🎯 NEXT STEPS FOR EDUCATIONAL MISSION:")
+    out.append("   1. Deploy version control system globally")
+    out.append("   2. Monitor data usage patterns in target regions")
+    out.append("   3. Add user education about data conservation")
+    out.append("   4. Implement progressive loading for slow connections")
+    out.append("   5. Track educational outcome correlations")
     
-    print(f"\\n🎯 NEXT STEPS FOR EDUCATIONAL MISSION:")
-    print("   1. Deploy version control system globally")
-    print("   2. Monitor data usage patterns in target regions") 
-    print("   3. Add user education about data conservation")
-    print("   4. Implement progressive loading for slow connections")
-    print("   5. Track educational outcome correlations")
+    sys.stdout.write("\n".join(out) + "\n")
 
 if __name__ == "__main__":
     test_educational_analytics()
\ No newline at end of file
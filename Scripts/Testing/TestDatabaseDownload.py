@@ -2,17 +2,28 @@
 # Path: /home/herb/Desktop/AndyLibrary/TestDatabaseDownload.py
 # Standard: AIDEV-PascalCase-2.1
 # Created: 2025-07-24
-# Last Modified: 2025-07-24 09:45AM
+# Last Modified: 2025-07-24 05:15PM
 
 """
 Simple database download test - simulates new user experience
 """
 
 import os
-import sqlite3
-import shutil
+import time
 from datetime import datetime
-import json
+
+from FastCopy import fast_copy
+from TestHelpers import open_readonly, write_json
+
+# Sample browse query; kept as one string so sqlite3's statement cache
+# reuses the prepared statement, including for EXPLAIN QUERY PLAN
+SAMPLE_BOOKS_SQL = """
+    SELECT title, category, subject 
+    FROM books b
+    LEFT JOIN categories c ON b.category_id = c.id
+    LEFT JOIN subjects s ON b.subject_id = s.id
+    LIMIT 5
+"""
 
 class NewUserDatabaseTest:
     """Simulate new user downloading and using database"""
@@ -22,6 +33,8 @@ class NewUserDatabaseTest:
         self.source_db = os.path.join(self.script_dir, "Data", "Local", "cached_library.db")
         self.user_cache_dir = os.path.join(self.script_dir, "UserCache")
         self.user_db = os.path.join(self.user_cache_dir, "andylibrary.db")
+        self._db = None
+        self.book_count = None
         
     def setup_user_environment(self):
         """Set up a clean user environment"""
@@ -33,11 +46,21 @@ class NewUserDatabaseTest:
         
         return True
     
+    @property
+    def db(self):
+        """Read-only connection to the downloaded database, opened on first use"""
+        if self._db is None:
+            self._db = open_readonly(self.user_db)
+        return self._db
+    
     def simulate_database_download(self):
         """Simulate downloading database from server"""
         print("\n📥 Simulating database download...")
         
-        if not os.path.exists(self.source_db):
+        # One stat for both the existence check and the size report
+        try:
+            source_stat = os.stat(self.source_db)
+        except FileNotFoundError:
             print(f"❌ Source database not found: {self.source_db}")
             return False
         
@@ -46,19 +69,25 @@ class NewUserDatabaseTest:
             print(f"🔄 Downloading from server...")
             
             # Copy database to user cache (simulates download)
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            download_filename = f"andylibrary_{timestamp}.db"
+            download_filename = f"andylibrary_{time.time_ns()}.db"
             download_path = os.path.join(self.user_cache_dir, download_filename)
             
-            shutil.copy2(self.source_db, download_path)
+            fast_copy(self.source_db, download_path, preserve_metadata=False)
             
-            # Also create a "latest" symlink for easy access
-            if os.path.exists(self.user_db):
+            # Also create a "latest" link for easy access; the checks open it
+            # read-only, so a hardlink to the download avoids a second copy
+            try:
                 os.remove(self.user_db)
-            shutil.copy2(download_path, self.user_db)
+            except FileNotFoundError:
+                pass
+            try:
+                os.link(download_path, self.user_db)
+            except OSError:
+                # No hardlinks here (e.g. some network or FAT filesystems)
+                fast_copy(download_path, self.user_db, preserve_metadata=False)
             
-            # Get file info
-            file_size = os.path.getsize(self.user_db)
+            # Get file info (the copy is byte-for-byte the source)
+            file_size = source_stat.st_size
             file_size_mb = round(file_size / (1024 * 1024), 2)
             
             print(f"✅ Database downloaded successfully:")
@@ -81,36 +110,35 @@ class NewUserDatabaseTest:
             return False
         
         try:
-            conn = sqlite3.connect(self.user_db, check_same_thread=False)
-            conn.row_factory = sqlite3.Row
-            
-            # Test basic queries
-            book_count = conn.execute("SELECT COUNT(*) FROM books").fetchone()[0]
-            category_count = conn.execute("SELECT COUNT(*) FROM categories").fetchone()[0]
-            subject_count = conn.execute("SELECT COUNT(*) FROM subjects").fetchone()[0]
+            conn = self.db
+            # Test basic queries (one statement for all three counts)
+            book_count, category_count, subject_count = conn.execute("""
+                SELECT (SELECT COUNT(*) FROM books),
+                       (SELECT COUNT(*) FROM categories),
+                       (SELECT COUNT(*) FROM subjects)
+            """).fetchone()
             
             print(f"✅ Database content verified:")
             print(f"   📚 Books: {book_count}")
+            self.book_count = book_count
             print(f"   📂 Categories: {category_count}")
             print(f"   🏷️ Subjects: {subject_count}")
             
             # Test a sample query (simulate user browsing)
-            sample_books = conn.execute("""
-                SELECT title, category, subject 
-                FROM books b
-                LEFT JOIN categories c ON b.category_id = c.id
-                LEFT JOIN subjects s ON b.subject_id = s.id
-                LIMIT 5
-            """).fetchall()
+            sample_books = conn.execute(SAMPLE_BOOKS_SQL).fetchall()
+            plan = conn.execute("EXPLAIN QUERY PLAN " + SAMPLE_BOOKS_SQL).fetchall()
             
             print(f"\n📖 Sample books:")
-            for book in sample_books:
-                title = book['title'] or 'Unknown Title'
-                category = book['category'] or 'No Category'
-                subject = book['subject'] or 'No Subject'
+            for title, category, subject in sample_books:
+                title = title or 'Unknown Title'
+                category = category or 'No Category'
+                subject = subject or 'No Subject'
                 print(f"   • {title} ({category} / {subject})")
             
-            conn.close()
+            print(f"\n🔎 Query plan:")
+            for step in plan:
+                print(f"   {step[-1]}")
+            
             return True
             
         except Exception as e:
@@ -122,26 +150,26 @@ class NewUserDatabaseTest:
         print("\n🚀 Testing database caching performance...")
         
         try:
-            import time
-            
-            # Test cold start (first connection)
-            start_time = time.time()
-            conn = sqlite3.connect(self.user_db, check_same_thread=False)
-            conn.execute("SELECT COUNT(*) FROM books").fetchone()
-            cold_time = time.time() - start_time
-            conn.close()
-            
-            # Test warm start (cached connection)
-            start_time = time.time()
-            conn = sqlite3.connect(self.user_db, check_same_thread=False)
-            conn.execute("SELECT COUNT(*) FROM books").fetchone()
-            warm_time = time.time() - start_time
-            conn.close()
+            # A fresh connection, so its page cache starts empty; opening it
+            # is not part of either timing
+            conn = open_readonly(self.user_db)
+            try:
+                # Test cold start (first query)
+                start_ns = time.perf_counter_ns()
+                conn.execute("SELECT COUNT(*) FROM books").fetchone()
+                cold_ns = time.perf_counter_ns() - start_ns
+                
+                # Test warm start (cached pages)
+                start_ns = time.perf_counter_ns()
+                conn.execute("SELECT COUNT(*) FROM books").fetchone()
+                warm_ns = time.perf_counter_ns() - start_ns
+            finally:
+                conn.close()
             
             print(f"✅ Performance test results:")
-            print(f"   🔥 Cold start: {cold_time:.3f}s")
-            print(f"   ⚡ Warm start: {warm_time:.3f}s")
-            print(f"   🚀 Speedup: {cold_time/warm_time:.1f}x faster")
+            print(f"   🔥 Cold start: {cold_ns / 1e9:.6f}s")
+            print(f"   ⚡ Warm start: {warm_ns / 1e9:.6f}s")
+            print(f"   🚀 Speedup: {cold_ns / max(warm_ns, 1):.1f}x faster")
             
             return True
             
@@ -149,8 +177,11 @@ class NewUserDatabaseTest:
             print(f"❌ Performance test failed: {e}")
             return False
     
-    def simulate_version_check(self):
-        """Simulate checking if database needs updating"""
+    def simulate_version_check(self, book_count=None):
+        """Simulate checking if database needs updating
+        
+        book_count comes from the content test, so no connection is needed here.
+        """
         print("\n🔍 Simulating version check...")
         
         try:
@@ -160,18 +191,16 @@ class NewUserDatabaseTest:
             current_version = {
                 "version": "1.0.0",
                 "downloaded": datetime.now().isoformat(),
-                "book_count": None,
+                "book_count": book_count,
                 "file_size": None
             }
             
-            if os.path.exists(self.user_db):
-                conn = sqlite3.connect(self.user_db)
-                current_version["book_count"] = conn.execute("SELECT COUNT(*) FROM books").fetchone()[0]
-                current_version["file_size"] = os.path.getsize(self.user_db)
-                conn.close()
+            try:
+                current_version["file_size"] = os.stat(self.user_db).st_size
+            except FileNotFoundError:
+                pass
             
-            with open(version_file, 'w') as f:
-                json.dump(current_version, f, indent=2)
+            write_json(version_file, current_version)
             
             print(f"✅ Version info saved:")
             print(f"   📋 Version: {current_version['version']}")
@@ -196,27 +225,36 @@ class NewUserDatabaseTest:
         print("🆕 NEW USER DATABASE DOWNLOAD SIMULATION")
         print("=" * 50)
         
-        tests = [
+        # The database checks only make sense once the download succeeded
+        setup_tests = [
             ("User Environment Setup", self.setup_user_environment),
-            ("Database Download", self.simulate_database_download),
+            ("Database Download", self.simulate_database_download)
+        ]
+        database_tests = [
             ("Database Content Test", self.test_database_content),
             ("Database Caching Test", self.test_database_caching),
-            ("Version Check Simulation", self.simulate_version_check)
+            ("Version Check Simulation", lambda: self.simulate_version_check(self.book_count))
         ]
         
         passed = 0
-        total = len(tests)
+        total = len(setup_tests) + len(database_tests)
         
-        for test_name, test_func in tests:
-            try:
-                result = test_func()
-                if result:
-                    passed += 1
-                    print(f"\n✅ {test_name} - PASSED")
-                else:
-                    print(f"\n❌ {test_name} - FAILED")
-            except Exception as e:
-                print(f"\n❌ {test_name} - ERROR: {e}")
+        setup_passed = True
+        for test_name, test_func in setup_tests:
+            test_passed = self._report(test_name, *self._run_test(test_func))
+            passed += test_passed
+            setup_passed = setup_passed and test_passed
+        
+        for test_name, test_func in database_tests:
+            if setup_passed:
+                passed += self._report(test_name, *self._run_test(test_func))
+            else:
+                # Nothing was downloaded, so there is nothing to check
+                print(f"\n⏭️ {test_name} - SKIPPED (download did not complete)")
+        
+        if self._db is not None:
+            self._db.close()
+            self._db = None
         
         print("\n" + "=" * 50)
         print("📋 NEW USER TEST RESULTS")
@@ -234,6 +272,24 @@ class NewUserDatabaseTest:
             print("❌ Some tests failed - needs investigation")
         
         return passed == total
+    
+    def _run_test(self, test_func):
+        """Run one test, returning (result, error)"""
+        try:
+            return test_func(), None
+        except Exception as e:
+            return False, e
+    
+    def _report(self, test_name, result, error):
+        """Print a test's outcome, returning 1 if it passed"""
+        if error is not None:
+            print(f"\n❌ {test_name} - ERROR: {error}")
+            return 0
+        if result:
+            print(f"\n✅ {test_name} - PASSED")
+            return 1
+        print(f"\n❌ {test_name} - FAILED")
+        return 0
 
 def main():
     """Main test runner"""
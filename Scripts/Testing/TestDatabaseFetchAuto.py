@@ -2,21 +2,22 @@
 # Path: /home/herb/Desktop/AndyLibrary/TestDatabaseFetchAuto.py
 # Standard: AIDEV-PascalCase-2.1
 # Created: 2025-07-24
-# Last Modified: 2025-07-24 09:55AM
+# Last Modified: 2025-07-24 04:00PM
 
 """
 Automated database fetch test - no user interaction required
 """
 
 import os
-import shutil
 import tempfile
 import sqlite3
-import subprocess
 import sys
+import threading
 import time
 from pathlib import Path
 
+from TestHelpers import tune_scratch
+
 def test_database_fetch_and_launch():
     """Test complete database fetch and app launch workflow"""
     print("🎯 AUTOMATED DATABASE FETCH & LAUNCH TEST")
@@ -38,89 +39,98 @@ def test_database_fetch_and_launch():
             print(f"❌ Source database not found: {source_db}")
             return False
         
-        shutil.copy2(source_db, temp_db_path)
+        # Copy through the backup API so a WAL-mode source still yields a
+        # consistent snapshot (a file copy can miss the -wal contents)
+        src = sqlite3.connect(f"{source_db.resolve().as_uri()}?mode=ro", uri=True)
+        dst = sqlite3.connect(temp_db_path)
+        # The temp copy is single-use and written by this process only, so
+        # skip the journal and per-statement locking while it is filled
+        dst.execute("PRAGMA journal_mode=OFF")
+        dst.execute("PRAGMA locking_mode=EXCLUSIVE")
+        with dst:
+            src.backup(dst, pages=0)
+        src.close()
+        tune_scratch(dst)
         file_size = os.path.getsize(temp_db_path)
         print(f"✅ Database fetched: {file_size / 1024:.1f} KB")
         
         # Step 2: Verify database content
         print("\n📊 Step 2: Verifying database...")
-        conn = sqlite3.connect(temp_db_path)
-        book_count = conn.execute("SELECT COUNT(*) FROM books").fetchone()[0]
-        category_count = conn.execute("SELECT COUNT(*) FROM categories").fetchone()[0]
-        sample_book = conn.execute("SELECT title FROM books LIMIT 1").fetchone()[0]
+        # Verify on the connection that just filled the copy, so its page
+        # cache is already warm; query_only keeps the probes read-only, and
+        # all three run in one statement
+        conn = dst
+        conn.execute("PRAGMA query_only=ON")
+        book_count, category_count, sample_book = conn.execute("""
+            SELECT (SELECT COUNT(*) FROM books),
+                   (SELECT COUNT(*) FROM categories),
+                   (SELECT title FROM books LIMIT 1)
+        """).fetchone()
         conn.close()
         
         print(f"✅ Database verified: {book_count} books, {category_count} categories")
         print(f"   📖 Sample: {sample_book}")
         
-        # Step 3: Create launcher script
-        print("\n🚀 Step 3: Creating app launcher...")
-        launcher_script = f"""#!/usr/bin/env python3
-import os
-import sys
-
-# Add project to path
-sys.path.insert(0, '{project_root}')
-
-# Set environment to use our temp database
-os.environ['ANDYGOOGLE_TEMP_DB'] = '{temp_db_path}'
-os.environ['ANDYGOOGLE_MODE'] = 'local'
-
-print("🔍 Using temp database: {temp_db_path}")
-print("🌐 Starting server on port 8090...")
-
-# Import and start server
-from Source.API.MainAPI import app
-import uvicorn
-
-if __name__ == "__main__":
-    uvicorn.run(app, host="127.0.0.1", port=8090, log_level="warning")
-"""
+        # Step 3: Start the app in-process
+        print("\n🚀 Step 3: Starting app in-process...")
         
-        launcher_path = os.path.join(temp_dir, "launch_temp_app.py")
-        with open(launcher_path, 'w') as f:
-            f.write(launcher_script)
+        # Point the app at our temp database before it is imported
+        os.environ['ANDYGOOGLE_TEMP_DB'] = temp_db_path
+        os.environ['ANDYGOOGLE_MODE'] = 'local'
+        sys.path.insert(0, str(project_root))
         
-        # Make it executable
-        os.chmod(launcher_path, 0o755)
+        # Serve from a thread in this interpreter rather than a subprocess,
+        # so there is no second Python startup or module import to wait on
+        from Source.API.MainAPI import app
+        import uvicorn
         
-        print(f"✅ Launcher created: {launcher_path}")
+        server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=8090, log_level="warning"))
+        server_thread = threading.Thread(target=server.run, daemon=True)
+        server_thread.start()
+        
+        print(f"✅ Server starting on port 8090 with: {temp_db_path}")
         
         # Step 4: Quick app test
         print("\n🧪 Step 4: Testing app launch...")
-        
-        # Set environment variables
-        env = os.environ.copy()
-        env['ANDYGOOGLE_TEMP_DB'] = temp_db_path
-        env['ANDYGOOGLE_MODE'] = 'local'
-        
-        # Start app process
-        process = subprocess.Popen([
-            sys.executable, launcher_path
-        ], env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE, 
-        universal_newlines=True)
-        
-        # Give it time to start
         print("   ⏳ Waiting for app to start...")
-        time.sleep(4)
         
         # Test connectivity
         try:
             import requests
+            from requests.adapters import HTTPAdapter
+            
+            # One keep-alive connection shared by every probe below
+            session = requests.Session()
+            session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
             
-            # Test health endpoint
-            response = requests.get("http://127.0.0.1:8090/api/health", timeout=3)
-            if response.status_code == 200:
+            # Poll the health endpoint with backoff until the app answers
+            # (about 6.4s at most) instead of sleeping a fixed time
+            response = None
+            for delay in (0.1, 0.1, 0.2, 0.4, 0.8, 1.6, 3.2):
+                time.sleep(delay)
+                if not server_thread.is_alive():
+                    break
+                try:
+                    response = session.get("http://127.0.0.1:8090/api/health", timeout=0.5)
+                except requests.RequestException:
+                    continue
+                if response.status_code == 200:
+                    break
+            
+            if response is None:
+                print("   ❌ Health check failed: app did not respond")
+                app_working = False
+            elif response.status_code == 200:
                 print("   ✅ Health check passed")
                 
                 # Test database access
-                stats_response = requests.get("http://127.0.0.1:8090/api/stats", timeout=3)
+                stats_response = session.get("http://127.0.0.1:8090/api/stats", timeout=3)
                 if stats_response.status_code == 200:
                     stats = stats_response.json()
                     print(f"   ✅ Database working: {stats.get('total_books')} books accessible")
                     
                     # Test a quick API call
-                    categories_response = requests.get("http://127.0.0.1:8090/api/categories", timeout=3)
+                    categories_response = session.get("http://127.0.0.1:8090/api/categories", timeout=3)
                     if categories_response.status_code == 200:
                         categories = categories_response.json()
                         print(f"   ✅ API working: {len(categories)} categories loaded")
@@ -134,17 +144,16 @@ if __name__ == "__main__":
             else:
                 print(f"   ❌ Health check failed: {response.status_code}")
                 app_working = False
+            
+            session.close()
                 
         except Exception as e:
             print(f"   ❌ Connectivity test failed: {e}")
             app_working = False
         
-        # Stop the process
-        process.terminate()
-        try:
-            process.wait(timeout=3)
-        except subprocess.TimeoutExpired:
-            process.kill()
+        # Stop the server
+        server.should_exit = True
+        server_thread.join(timeout=3)
         
         # Results
         print("\n" + "=" * 50)
@@ -152,7 +161,7 @@ if __name__ == "__main__":
         print("=" * 50)
         print("✅ Database fetch: SUCCESS")
         print("✅ Database verification: SUCCESS") 
-        print("✅ Launcher creation: SUCCESS")
+        print("✅ App startup: SUCCESS")
         print(f"{'✅' if app_working else '❌'} App functionality: {'SUCCESS' if app_working else 'FAILED'}")
         
         if app_working:
@@ -164,7 +173,7 @@ if __name__ == "__main__":
             print("   4. ✅ All 1219 books accessible via API")
             
             print(f"\n🚀 To manually launch:")
-            print(f"   python {launcher_path}")
+            print(f"   python {project_root / 'TempAppLauncher.py'} {temp_db_path}")
             print(f"   Then browse to: http://127.0.0.1:8090")
         else:
             print("\n⚠️ PARTIAL SUCCESS")
@@ -173,7 +182,6 @@ if __name__ == "__main__":
         # Keep files for manual testing
         print(f"\n📁 Files preserved for manual testing:")
         print(f"   Database: {temp_db_path}")
-        print(f"   Launcher: {launcher_path}")
         
         return app_working
         
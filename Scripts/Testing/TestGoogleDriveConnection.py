@@ -2,7 +2,7 @@
 # Path: /home/herb/Desktop/AndyLibrary/TestGoogleDriveConnection.py
 # Standard: AIDEV-PascalCase-2.1
 # Created: 2025-07-24
-# Last Modified: 2025-07-24 02:15PM
+# Last Modified: 2025-07-24 04:00PM
 
 """
 Test Google Drive Connection for AndyLibrary
@@ -10,13 +10,37 @@ Validates authentication and basic functionality without requiring manual input
 """
 
 import os
+import sqlite3
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, Any, Optional
 
 # Add project root to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from Source.Core.StudentGoogleDriveAPI import StudentGoogleDriveAPI, GOOGLE_AVAILABLE
+from Source.Core.StudentBookDownloader import StudentBookDownloader
+from Source.Core.ChunkedDownloader import ChunkedDownloader
+from TestHelpers import tune_reads
+
+# Shared instances, created on first use so a constructor failure is still
+# reported by the test that needs it rather than aborting the whole run
+_DOWNLOADER = None
+_CHUNKED = None
+
+def GetDownloader() -> StudentBookDownloader:
+    """Return the shared StudentBookDownloader"""
+    global _DOWNLOADER
+    if _DOWNLOADER is None:
+        _DOWNLOADER = StudentBookDownloader()
+    return _DOWNLOADER
+
+def GetChunkedDownloader() -> ChunkedDownloader:
+    """Return the shared ChunkedDownloader"""
+    global _CHUNKED
+    if _CHUNKED is None:
+        _CHUNKED = ChunkedDownloader()
+    return _CHUNKED
 
 def TestGoogleCredentials() -> Dict[str, Any]:
     """Test if Google credentials are properly configured"""
@@ -57,8 +81,7 @@ def TestStudentBookDownloaderIntegration() -> Dict[str, Any]:
     result = {'success': False, 'details': []}
     
     try:
-        from Source.Core.StudentBookDownloader import StudentBookDownloader
-        downloader = StudentBookDownloader()
+        downloader = GetDownloader()
         result['details'].append("✅ StudentBookDownloader initialized")
         
         # Test cost estimation for first book
@@ -85,8 +108,7 @@ def TestChunkedDownloaderIntegration() -> Dict[str, Any]:
     result = {'success': False, 'details': []}
     
     try:
-        from Source.Core.ChunkedDownloader import ChunkedDownloader, NetworkCondition
-        downloader = ChunkedDownloader()
+        downloader = GetChunkedDownloader()
         result['details'].append("✅ ChunkedDownloader initialized")
         
         # Test network condition detection
@@ -109,7 +131,6 @@ def TestDatabaseConnection() -> Dict[str, Any]:
     result = {'success': False, 'details': []}
     
     try:
-        import sqlite3
         db_path = "Data/Databases/MyLibrary.db"
         
         if not os.path.exists(db_path):
@@ -118,18 +139,24 @@ def TestDatabaseConnection() -> Dict[str, Any]:
         
         result['details'].append(f"✅ Database found: {db_path}")
         
-        # Test database connection
-        conn = sqlite3.connect(db_path)
+        # Test database connection; this is the app's real library, so open
+        # it read-only and leave its journal mode alone
+        conn = tune_reads(sqlite3.connect(f"file:{db_path}?mode=ro", uri=True))
         cursor = conn.cursor()
         
-        # Get basic stats
-        cursor.execute("SELECT COUNT(*) FROM books")
-        book_count = cursor.fetchone()[0]
-        result['details'].append(f"✅ Books in database: {book_count}")
+        # One read transaction for both queries
+        with conn:
+            cursor.execute("BEGIN")
+            
+            # Get basic stats
+            cursor.execute("SELECT COUNT(*) FROM books")
+            book_count = cursor.fetchone()[0]
+            
+            # Get sample book
+            cursor.execute("SELECT id, title, author, FileSize FROM books LIMIT 1")
+            sample_book = cursor.fetchone()
         
-        # Get sample book
-        cursor.execute("SELECT id, title, author, FileSize FROM books LIMIT 1")
-        sample_book = cursor.fetchone()
+        result['details'].append(f"✅ Books in database: {book_count}")
         if sample_book:
             book_id, title, author, file_size = sample_book
             size_mb = (file_size or 5000000) / (1024 * 1024)
@@ -158,12 +185,18 @@ def RunAllTests() -> None:
     
     results = {}
     
-    for test_name, test_func in tests:
+    # The checks share no state, so overlap their file, database and network
+    # waits; the report below still follows the original order
+    with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+        futures = {executor.submit(test_func): test_name for test_name, test_func in tests}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+    
+    for test_name, _ in tests:
         print(f"\n🔍 Testing: {test_name}")
         print("-" * 40)
         
-        result = test_func()
-        results[test_name] = result
+        result = results[test_name]
         
         for detail in result['details']:
             print(f"  {detail}")
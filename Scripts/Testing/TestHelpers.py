@@ -0,0 +1,73 @@
+# File: TestHelpers.py
+# Path: /home/herb/Desktop/AndyLibrary/TestHelpers.py
+# Standard: AIDEV-PascalCase-2.1
+# Created: 2025-07-24
+# Last Modified: 2025-07-24 05:05PM
+
+"""
+Shared Test Helpers
+SQLite connection tuning and file output used by the database test scripts
+"""
+
+import json
+import os
+import sqlite3
+from pathlib import Path
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Per-connection read settings; none of these persist in the database file
+READ_PRAGMAS = """
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-64000;
+    PRAGMA mmap_size=268435456;
+"""
+
+def tune_reads(conn):
+    """Apply the read pragmas; safe on any database, including read-only ones"""
+    conn.executescript(READ_PRAGMAS)
+    return conn
+
+def tune_scratch(conn):
+    """Switch a database the test owns to WAL, then apply the read pragmas
+
+    WAL is recorded in the file header, so never use this on the app's
+    real library.
+    """
+    conn.executescript("""
+        PRAGMA journal_mode=WAL;
+        PRAGMA synchronous=NORMAL;
+    """ + READ_PRAGMAS)
+    return conn
+
+def open_db(path):
+    """Open a database the test owns, tuned for the read-heavy checks"""
+    return tune_scratch(sqlite3.connect(path, check_same_thread=False))
+
+def open_readonly(path):
+    """Open a database read-only with the read pragmas; it is never written"""
+    conn = sqlite3.connect(f"{Path(path).resolve().as_uri()}?mode=ro", uri=True,
+                           check_same_thread=False)
+    return tune_reads(conn)
+
+def write_all(fd, data):
+    """Write every byte of data to fd, continuing after short writes"""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+def write_json(path, data):
+    """Serialize data once and write it with as few os.write calls as possible"""
+    if HAS_ORJSON:
+        blob = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        blob = json.dumps(data, indent=2).encode()
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        write_all(fd, blob)
+    finally:
+        os.close(fd)